@@ -2,7 +2,7 @@ import sys
 from typing import List
 
 import multiexit
-from PyQt5.QtCore import QAbstractEventDispatcher, QThreadPool
+from PyQt5.QtCore import QAbstractEventDispatcher, Qt, QThreadPool
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QApplication, QStyle
 from pyqtkeybind import keybinder
@@ -49,15 +49,27 @@ def run():
     screenshot_service = ScreenshotService(file_name_composer)
     app_settings = AppSettings(app)
 
+    # A single worker keeps saves, and thus screenshot_taken, in capture order
+    screenshot_thread_pool = QThreadPool(app)
+    screenshot_thread_pool.setMaxThreadCount(1)
+
     screenshot_controller = ScreenShotController(
         sim_service=sim_service,
         metadata_service=metadata_service,
         screenshot_service=screenshot_service,
         file_name_composer=file_name_composer,
         settings=app_settings,
+        thread_pool=screenshot_thread_pool,
         parent=app,
     )
 
+    def on_about_to_quit():
+        # let queued saves finish tagging before ExifTool is shut down
+        screenshot_thread_pool.waitForDone()
+        metadata_service.close()
+
+    app.aboutToQuit.connect(on_about_to_quit)
+
     main_window = MainWindow(
         file_name_composer=file_name_composer,
         settings=app_settings,
@@ -77,7 +89,10 @@ def run():
     )
     thumbnail_maker.thumb_ready.connect(main_window.on_thumbnail_ready)  # type: ignore
 
-    main_window.screenshot_requested.connect(screenshot_controller.take_screenshot)  # type: ignore
+    main_window.screenshot_requested.connect(
+        screenshot_controller.take_screenshot,  # type: ignore
+        Qt.ConnectionType.QueuedConnection,
+    )
     main_window.credits_requested.connect(lambda: show_credits(main_window))
 
     tray_icon_widget = AppTrayIcon(icon_tray, main_window)
@@ -108,7 +123,8 @@ def run():
         HotkeyID.take_screenshot, app_settings.screenshot_hotkey, main_window
     )
     hotkey_service.take_screenshot_pressed.connect(
-        screenshot_controller.take_screenshot  # type: ignore
+        screenshot_controller.take_screenshot,  # type: ignore
+        Qt.ConnectionType.QueuedConnection,
     )
 
     main_window.hotkey_changed.connect(
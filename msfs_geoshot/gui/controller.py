@@ -1,3 +1,4 @@
+import sys
 import time
 import uuid
 from dataclasses import dataclass
@@ -5,14 +6,16 @@ from pathlib import Path
 from typing import Optional
 
 from msfs_geoshot.gui.settings import AppSettings
-from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+from PIL import Image
+from PyQt5.QtCore import QObject, QThreadPool, pyqtSignal, pyqtSlot
 
 from .. import MOCK_SIMULATOR
 from ..metadata import Metadata, MetadataService
 from ..names import FileNameComposer
-from ..screenshots import ScreenshotService
+from ..screenshots import ImageFormat, ScreenshotService
 from ..sim import SimService, SimServiceError
 from ..windows import get_window_rectangle, raise_window_to_foreground
+from .threading import Runner
 
 
 @dataclass
@@ -21,6 +24,12 @@ class ScreenShotResult:
     metadata: Optional[Metadata]
 
 
+@dataclass
+class _SaveResult:
+    result: ScreenShotResult
+    error: Optional[str]
+
+
 class ScreenShotController(QObject):
 
     sim_window_found = pyqtSignal()
@@ -34,9 +43,11 @@ class ScreenShotController(QObject):
         screenshot_service: ScreenshotService,
         file_name_composer: FileNameComposer,
         settings: AppSettings,
+        thread_pool: QThreadPool,
         parent: Optional[QObject] = None,
     ):
         super().__init__(parent)
+        self._thread_pool = thread_pool
         self._sim_service = sim_service
         self._metadata_service = metadata_service
         self._screenshot_service = screenshot_service
@@ -74,37 +85,84 @@ class ScreenShotController(QObject):
 
         self.sim_window_found.emit()
 
-        temporary_name = f"{round(time.time())}-{uuid.uuid4()}"
+        image = self._screenshot_service.grab_screenshot(
+            window_rectangle=window_rectangle
+        )
 
-        screenshot_path = self._screenshot_service.take_screenshot(
-            window_rectangle=window_rectangle,
+        # Encoding, tagging and geocoding do not need the GUI thread
+        runner = Runner(
+            self._save_screenshot,
+            image=image,
+            metadata=metadata,
             target_folder=self._settings.screenshot_folder,
-            name=temporary_name,
             image_format=self._settings.image_format,
+            png_compress_level=self._settings.png_compress_level,
+            name_format=self._settings.file_name_format,
+            date_format=self._settings.date_format,
         )
+        runner.signals.success.connect(self._on_screenshot_saved)  # type: ignore
+        runner.signals.error.connect(self._on_screenshot_save_failed)  # type: ignore
 
-        error = None
+        self._thread_pool.start(runner)
 
-        if metadata and not self._metadata_service.write_data(
-            image_path=screenshot_path, metadata=metadata
-        ):
-            error = "Could not write metadata to screenshot"
+    def _save_screenshot(
+        self,
+        image: Image.Image,
+        metadata: Optional[Metadata],
+        target_folder: Path,
+        image_format: ImageFormat,
+        png_compress_level: int,
+        name_format: str,
+        date_format: str,
+    ) -> _SaveResult:
+        temporary_name = f"{round(time.time())}-{uuid.uuid4()}"
 
-        screenshot_name = self._file_name_composer.compose_name(
-            name_format=self._settings.file_name_format,
-            date_format=self._settings.date_format,
-            metadata=metadata,
+        screenshot_path = self._screenshot_service.save_screenshot(
+            image=image,
+            target_folder=target_folder,
+            name=temporary_name,
+            image_format=image_format,
+            png_compress_level=png_compress_level,
         )
-        # avoid hitting Windows file name length limit
-        truncated_name = screenshot_name[:250]
 
-        screenshot_path = screenshot_path.rename(
-            screenshot_path.with_stem(truncated_name)
+        error = None
+
+        try:
+            if metadata and not self._metadata_service.write_data(
+                image_path=screenshot_path, metadata=metadata
+            ):
+                error = "Could not write metadata to screenshot"
+
+            screenshot_name = self._file_name_composer.compose_name(
+                name_format=name_format,
+                date_format=date_format,
+                metadata=metadata,
+            )
+            # avoid hitting Windows file name length limit
+            truncated_name = screenshot_name[:250]
+
+            screenshot_path = screenshot_path.rename(
+                screenshot_path.with_stem(truncated_name)
+            )
+        except Exception:
+            # do not leave the temporary file behind
+            screenshot_path.unlink(missing_ok=True)
+            raise
+
+        return _SaveResult(
+            result=ScreenShotResult(path=screenshot_path, metadata=metadata),
+            error=error,
         )
 
-        if error:
-            self.error.emit("Could not write metadata to screenshot")
+    @pyqtSlot(object)
+    def _on_screenshot_saved(self, save_result: _SaveResult):
+        if save_result.error:
+            self.error.emit(save_result.error)
         else:
-            self.screenshot_taken.emit(
-                ScreenShotResult(path=screenshot_path, metadata=metadata)
-            )
+            self.screenshot_taken.emit(save_result.result)
+
+    @pyqtSlot(object)
+    def _on_screenshot_save_failed(self, exception: Exception):
+        self.error.emit("Could not save screenshot")
+        # hand the worker's exception to the error handler like any other
+        sys.excepthook(type(exception), exception, exception.__traceback__)
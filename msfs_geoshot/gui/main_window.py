@@ -1,3 +1,4 @@
+import time
 import winsound
 from pathlib import Path
 from typing import Optional
@@ -35,8 +36,10 @@ class MainWindow(QMainWindow):
     hotkey_changed = pyqtSignal(HotkeyID, str)
     closed = pyqtSignal()
 
-    _maps_url = "https://www.google.com/maps/search/?api=1&query={latitude},{longitude}"
+    _maps_url = "https://www.google.com/maps/search/?api=1&query=%s,%s"
     _shutter_sound_path = str(RESOURCES_PATH / "shutter.wav")
+    _max_redraw_rate = 10  # Hz, upper bound for notification/thumbnail updates
+    _last_screenshot_check_ttl = 2.0  # s
 
     def __init__(
         self,
@@ -50,13 +53,24 @@ class MainWindow(QMainWindow):
         self._settings = settings
 
         self._last_screenshot: Optional[Path] = None
+        self._last_screenshot_verified_at: float = 0.0
         self._last_metadata: Optional[Metadata] = None
 
         self._notification_handler = NotificationHandler(parent=self)
 
+        # Coalesce bursts of screenshot results into one UI update per interval
+        self._pending_result: Optional[ScreenShotResult] = None
+        self._pending_thumb: Optional[QPixmap] = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(1000 // self._max_redraw_rate)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
         self._form = Ui_MainWindow()
         self._form.setupUi(self)
 
+        self._default_line_edit_palette = QLineEdit().palette()
+
         self._form.view_last_location.hide()
 
         self._select_hotkey = CustomKeySequenceEdit(parent=self)
@@ -83,20 +97,13 @@ class MainWindow(QMainWindow):
 
     @pyqtSlot(QPixmap)
     def on_thumbnail_ready(self, thumbnail: QPixmap):
-        cursor = QCursor()
-        cursor.setShape(Qt.CursorShape.PointingHandCursor)
-        self._thumbnail_widget.setCursor(cursor)
-        self._thumbnail_widget.setPixmap(thumbnail)
+        self._pending_thumb = thumbnail
+        self._schedule_flush()
 
     @pyqtSlot(ScreenShotResult)
     def on_screenshot_taken(self, result: ScreenShotResult):
-        if self._settings.show_notification:
-            self._notification_handler.notify(
-                message=f"<b>Screenshot saved</b>: {result.path.name}",
-                color=NotificationColor.success,
-                onclick=self._on_open_last_screenshot,  # type: ignore
-            )
-        self._set_last_opened_screenshot(path=result.path, metadata=result.metadata)
+        self._pending_result = result
+        self._schedule_flush()
 
     @pyqtSlot(str)
     def on_screenshot_error(self, message: str):
@@ -112,20 +119,34 @@ class MainWindow(QMainWindow):
                 self._shutter_sound_path, winsound.SND_FILENAME | winsound.SND_ASYNC
             )
 
-    def _setup_format_field_description(self):
-        supported_fields = self._file_name_composer.get_supported_fields()
-
-        lines = []
+    def _schedule_flush(self):
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
-        for field in supported_fields:
-            text = f"<b>{{{field.name}}}</b>: {field.description}"
-            if field.required:
-                text += " Required."
-            lines.append(text)
-
-        text = "<br>".join(lines)
+    @pyqtSlot()
+    def _flush_pending(self):
+        result, self._pending_result = self._pending_result, None
+        thumbnail, self._pending_thumb = self._pending_thumb, None
+
+        if result:
+            if self._settings.show_notification:
+                self._notification_handler.notify(
+                    message=f"<b>Screenshot saved</b>: {result.path.name}",
+                    color=NotificationColor.success,
+                    onclick=self._on_open_last_screenshot,  # type: ignore
+                )
+            self._set_last_opened_screenshot(path=result.path, metadata=result.metadata)
+
+        if thumbnail:
+            cursor = QCursor()
+            cursor.setShape(Qt.CursorShape.PointingHandCursor)
+            self._thumbnail_widget.setCursor(cursor)
+            self._thumbnail_widget.setPixmap(thumbnail)
 
-        self._form.available_fields.setText(text)
+    def _setup_format_field_description(self):
+        self._form.available_fields.setText(
+            self._file_name_composer.get_supported_fields_html()
+        )
 
     def _setup_input_validators(self):
         self._file_name_format_validator = FileNameFormatValidator(
@@ -146,7 +167,9 @@ class MainWindow(QMainWindow):
         self._form.date_format.setValidator(self._date_format_validator)
 
     def _setup_button_connections(self):
-        self._form.take_screenshot.clicked.connect(self.screenshot_requested)
+        self._form.take_screenshot.clicked.connect(
+            self._on_take_screenshot, Qt.ConnectionType.QueuedConnection
+        )
         self._form.quit_button.clicked.connect(
             self.quit, Qt.ConnectionType.QueuedConnection
         )  # queued connection recommended on slots that close QApplication
@@ -201,26 +224,31 @@ class MainWindow(QMainWindow):
         )
 
     def _load_ui_state_from_settings(self):
-        self._form.current_folder.setText(str(self._settings.screenshot_folder))
-        self._select_hotkey.setKeySequence(
-            QKeySequence(self._settings.screenshot_hotkey)
-        )
-        self._form.select_format.clear()
-        self._form.select_format.addItems(format.name for format in ImageFormat)
-        self._form.select_format.setCurrentText(self._settings.image_format.name)
-        self._form.file_name_format.setText(self._settings.file_name_format)
-        self._form.date_format.setText(self._settings.date_format)
-        self._form.minimize_to_tray.setChecked(self._settings.minimize_to_tray)
-        self._form.start_to_tray.setChecked(self._settings.start_to_tray)
-        self._form.play_sound.setChecked(self._settings.play_sound)
-        self._form.show_notification.setChecked(self._settings.show_notification)
+        # Batch widget invalidations into a single repaint
+        self._form.centralwidget.setUpdatesEnabled(False)
+        try:
+            self._form.current_folder.setText(str(self._settings.screenshot_folder))
+            self._select_hotkey.setKeySequence(
+                QKeySequence(self._settings.screenshot_hotkey)
+            )
+            self._form.select_format.clear()
+            self._form.select_format.addItems(format.name for format in ImageFormat)
+            self._form.select_format.setCurrentText(self._settings.image_format.name)
+            self._form.file_name_format.setText(self._settings.file_name_format)
+            self._form.date_format.setText(self._settings.date_format)
+            self._form.minimize_to_tray.setChecked(self._settings.minimize_to_tray)
+            self._form.start_to_tray.setChecked(self._settings.start_to_tray)
+            self._form.play_sound.setChecked(self._settings.play_sound)
+            self._form.show_notification.setChecked(self._settings.show_notification)
+        finally:
+            self._form.centralwidget.setUpdatesEnabled(True)
 
     @pyqtSlot()
     def _on_file_name_format_save(self):
         if not self._form.file_name_format.hasAcceptableInput():
             return  # should not happen
         self._settings.file_name_format = self._form.file_name_format.text()
-        self._form.file_name_format.setPalette(QLineEdit().palette())
+        self._form.file_name_format.setPalette(self._default_line_edit_palette)
         self._form.file_name_format_save.setDisabled(True)
 
     @pyqtSlot()
@@ -228,9 +256,13 @@ class MainWindow(QMainWindow):
         if not self._form.date_format.hasAcceptableInput():
             return  # should not happen
         self._settings.date_format = self._form.date_format.text()
-        self._form.date_format.setPalette(QLineEdit().palette())
+        self._form.date_format.setPalette(self._default_line_edit_palette)
         self._form.date_format_save.setDisabled(True)
 
+    @pyqtSlot()
+    def _on_take_screenshot(self):
+        self.screenshot_requested.emit()
+
     @pyqtSlot()
     def _on_restore_defaults(self):
         self._settings.restore_defaults()
@@ -309,6 +341,7 @@ class MainWindow(QMainWindow):
     ):
         # self._form.view_last_screenshot.setEnabled(True)
         self._last_screenshot = path
+        self._last_screenshot_verified_at = time.monotonic()  # just written
 
         if (
             metadata
@@ -323,11 +356,16 @@ class MainWindow(QMainWindow):
     def _on_open_last_screenshot(self):
         if not self._last_screenshot:
             return False
-        elif not self._last_screenshot.is_file():
-            self._notification_handler.notify(
-                "File no longer exists", color=NotificationColor.error
-            )
-            return False
+
+        now = time.monotonic()
+        if now - self._last_screenshot_verified_at > self._last_screenshot_check_ttl:
+            if not self._last_screenshot.is_file():
+                self._notification_handler.notify(
+                    "File no longer exists", color=NotificationColor.error
+                )
+                return False
+            self._last_screenshot_verified_at = now
+
         url = QUrl.fromLocalFile(str(self._last_screenshot))
         QDesktopServices.openUrl(url)
 
@@ -342,7 +380,7 @@ class MainWindow(QMainWindow):
             print("Invalid GPS data for last screenshot")
             return
 
-        url = self._maps_url.format(latitude=latitude, longitude=longitude)
+        url = self._maps_url % (latitude, longitude)
         open_url(url)
 
     @pyqtSlot()
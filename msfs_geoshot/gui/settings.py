@@ -15,6 +15,9 @@ class _SettingsData:
         Path(QStandardPaths.writableLocation(QStandardPaths.PicturesLocation)) / "MSFS"
     )
     image_format: ImageFormat = ImageFormat.JPEG
+    # 0-9, higher is smaller but slower. Screenshots favor a single fast
+    # deflate pass over a slightly smaller file.
+    png_compress_level: int = 1
     screenshot_hotkey: str = "Ctrl+Shift+S"
     file_name_format: str = "MSFS_{datetime}_{geocode}"
     date_format: str = "%Y-%m-%d-%H%M%S"
@@ -72,6 +75,18 @@ class AppSettings(QObject):
     def image_format(self, value: ImageFormat):
         self._settings.setValue("image_format", value.name)
 
+    @property
+    def png_compress_level(self) -> int:
+        key = "png_compress_level"
+        if not self._settings.contains(key):
+            return self._defaults.png_compress_level
+        # hand-edited values outside of zlib's range would fail every save
+        return min(max(self._settings.value(key, type=int), 0), 9)
+
+    @png_compress_level.setter
+    def png_compress_level(self, value: int):
+        self._settings.setValue("png_compress_level", value)
+
     @property
     def screenshot_hotkey(self) -> str:
         key = "screenshot_hotkey"
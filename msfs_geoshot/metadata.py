@@ -7,9 +7,10 @@ Used under the GNU Affero General Public License v3.0
 """
 
 import subprocess
+import threading
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from . import DEBUG, BINARY_PATH, __app_name__, __version__
 
@@ -83,13 +84,23 @@ class Metadata:
 class MetadataService:
 
     _exiftool = BINARY_PATH / "exiftool.exe"
+    _ready_marker = "{ready}"
+    _timeout = 30  # s, upper bound for tagging a single screenshot
+
+    def __init__(self):
+        # Kept running in -stay_open mode so that each screenshot does not
+        # pay for starting up a new ExifTool process
+        self._process: Optional[subprocess.Popen] = None
+        self._closed = False
+        # Screenshots are tagged from worker threads, serialize access
+        self._lock = threading.Lock()
 
     def write_data(
         self,
         image_path: Path,
         metadata: Metadata,
     ) -> bool:
-        arguments = ["-n", "-overwrite_original"]
+        arguments = ["-n", "-overwrite_original", "-charset", "filename=UTF8"]
 
         if DEBUG:
             arguments.append("-verbose")
@@ -104,30 +115,96 @@ class MetadataService:
                 continue
             elif value is None:
                 continue
+            # arguments are passed one per line, so values must not span lines
+            value = str(value).replace("\r", " ").replace("\n", " ")
             arguments.append(f"-{attribute}={value}")
 
-        command_line = [str(self._exiftool)] + arguments + [str(image_path)]
+        arguments.append(str(image_path))
 
         if DEBUG:
-            print(command_line)
+            print(arguments)
 
-        try:
-            output = subprocess.check_output(
-                command_line,
-                text=True,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-                stdin=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-            if DEBUG:
-                print(output)
-        except subprocess.CalledProcessError as e:
-            print(e.output)
+        output = self._execute(arguments)
+
+        if output is None:
             return False
-        except subprocess.SubprocessError as e:
-            print(e)
+
+        if DEBUG:
+            print(output)
+
+        if "1 image files updated" not in output:
+            print(output)
             return False
-        except Exception as e:
-            raise e
 
         return True
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            if self._process is None:
+                return
+            process, self._process = self._process, None
+            try:
+                self._send_lines(process, ["-stay_open", "False"])
+                process.wait(timeout=5)
+            except (OSError, subprocess.SubprocessError) as e:
+                print(e)
+                process.kill()
+
+    def _execute(self, arguments: List[str]) -> Optional[str]:
+        with self._lock:
+            try:
+                process = self._get_process()
+                # kill a hung ExifTool so the pending read returns and the
+                # worker (and waiting for it on quit) does not block forever
+                watchdog = threading.Timer(self._timeout, process.kill)
+                watchdog.daemon = True
+                watchdog.start()
+                try:
+                    self._send_lines(process, arguments + ["-execute"])
+                    return self._read_until_ready(process)
+                finally:
+                    watchdog.cancel()
+            except Exception as e:
+                print(e)
+                self._discard_process()
+                return None
+
+    def _get_process(self) -> subprocess.Popen:
+        if self._closed:
+            # do not leave a stray -stay_open process behind after shutdown
+            raise subprocess.SubprocessError("Metadata service has been closed")
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                [str(self._exiftool), "-stay_open", "True", "-@", "-"],
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                creationflags=subprocess.CREATE_NO_WINDOW,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+            )
+        return self._process
+
+    def _send_lines(self, process: subprocess.Popen, lines: List[str]):
+        assert process.stdin is not None
+        process.stdin.write("".join(f"{line}\n" for line in lines))
+        process.stdin.flush()
+
+    def _read_until_ready(self, process: subprocess.Popen) -> str:
+        assert process.stdout is not None
+        lines: List[str] = []
+        while True:
+            line = process.stdout.readline()
+            if not line:
+                raise subprocess.SubprocessError("ExifTool exited unexpectedly")
+            if line.strip() == self._ready_marker:
+                return "".join(lines)
+            lines.append(line)
+
+    def _discard_process(self):
+        if self._process is None:
+            return
+        process, self._process = self._process, None
+        process.kill()
@@ -1,8 +1,9 @@
 from os import name
+import functools
 import string
 import time
 from datetime import date, datetime
-from typing import Dict, List, NamedTuple, Optional, Tuple, cast
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, cast
 
 from pathvalidate import ValidationError, validate_filename  # type: ignore
 import tzlocal
@@ -36,20 +37,41 @@ OSM Nominatim</a>.""",
 ]
 
 
+@functools.lru_cache(maxsize=1)
+def _get_fields_html(fields: Tuple[FileNameField, ...]) -> str:
+    lines = []
+
+    for field in fields:
+        text = f"<b>{{{field.name}}}</b>: {field.description}"
+        if field.required:
+            text += " Required."
+        lines.append(text)
+
+    return "<br>".join(lines)
+
+
 class FileNameComposer:
 
     _user_agent = __app_name__.replace(" ", "_")
 
+    def __init__(self):
+        # Formats only change when the user saves new ones, so validate
+        # each combination once instead of on every screenshot
+        self._valid_formats: Set[Tuple[str, str]] = set()
+
     def compose_name(
         self, name_format: str, date_format: str, metadata: Optional[Metadata] = None
     ):
-        is_valid_name_format, error = self.is_name_format_valid(name_format)
-        if not is_valid_name_format:
-            raise ValueError(f"Invalid format string provided: {error}")
+        if (name_format, date_format) not in self._valid_formats:
+            is_valid_name_format, error = self.is_name_format_valid(name_format)
+            if not is_valid_name_format:
+                raise ValueError(f"Invalid format string provided: {error}")
+
+            is_valid_date_format, error = self.is_date_format_valid(date_format)
+            if not is_valid_date_format:
+                raise ValueError(f"Invalid format string provided: {error}")
 
-        is_valid_date_format, error = self.is_date_format_valid(date_format)
-        if not is_valid_date_format:
-            raise ValueError(f"Invalid format string provided: {error}")
+            self._valid_formats.add((name_format, date_format))
 
         capture_time = metadata.capture_time if metadata else time.time()
 
@@ -120,6 +142,9 @@ class FileNameComposer:
     def get_supported_fields(self) -> List[FileNameField]:
         return _file_name_fields
 
+    def get_supported_fields_html(self) -> str:
+        return _get_fields_html(tuple(self.get_supported_fields()))
+
     def _maybe_get_geocode_string(self, metadata: Metadata) -> Optional[str]:
         try:
             geolocator = Nominatim(user_agent=self._user_agent)
@@ -1,13 +1,13 @@
 from dataclasses import asdict, dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
-from PIL import ImageGrab
+from PIL import Image, ImageGrab
 
 from . import __app_name__
 from .names import FileNameComposer
-from .windows import WindowRectangle
+from .windows import WindowRectangle, grab_screen_area
 
 
 class ImageFormat(Enum):
@@ -29,60 +29,80 @@ class ScreenshotService:
 
     _settings_by_image_format: Dict[ImageFormat, _ImageFormatSettings] = {
         ImageFormat.PNG: _ImageFormatSettings(
-            # optimize would imply compress_level=9
-            compress_level=6,
+            # optimize would imply compress_level=9. The level itself is a
+            # user setting, see AppSettings.png_compress_level.
+            optimize=False,
         ),
         ImageFormat.JPEG: _ImageFormatSettings(
-            quality=100,
+            quality=92,  # visually lossless, roughly half the size of 100
             optimize=True,
             progressive=True,
         ),
         ImageFormat.TIFF: _ImageFormatSettings(
-            compression="tiff_adobe_deflate",  # equivalent to ZIP. alternative: lzwa
+            # uncompressed: the write is a plain dump of the pixel buffer
+            # instead of a CPU-bound deflate/LZW pass over the whole frame
+            compression="raw",
         ),
     }
 
     def __init__(self, file_name_composer: FileNameComposer):
         self._file_name_composer = file_name_composer
+        # Resolve Pillow save options once instead of on every screenshot
+        self._save_options_by_image_format: Dict[ImageFormat, Dict[str, Any]] = {
+            image_format: {
+                key: value
+                for key, value in asdict(image_format_settings).items()
+                if value is not None
+            }
+            for (
+                image_format,
+                image_format_settings,
+            ) in self._settings_by_image_format.items()
+        }
 
-    def take_screenshot(
+    def grab_screenshot(
+        self, window_rectangle: Optional[WindowRectangle] = None
+    ) -> Image.Image:
+        if window_rectangle:
+            # Blit only the window area instead of grabbing all screens and
+            # cropping the result
+            return Image.frombuffer(
+                "RGB",
+                (window_rectangle.width(), window_rectangle.height()),
+                grab_screen_area(window_rectangle),
+                "raw",
+                "BGRX",
+                0,
+                1,
+            )
+        return ImageGrab.grab()  # full screen
+
+    def save_screenshot(
         self,
+        image: Image.Image,
         target_folder: Path,
         name: str,
-        window_rectangle: Optional[WindowRectangle] = None,
         image_format: ImageFormat = ImageFormat.JPEG,
+        png_compress_level: Optional[int] = None,
     ) -> Path:
+        """Encode a grabbed screenshot to disk. Safe to call off the GUI thread."""
         if not target_folder.is_dir():
             target_folder.mkdir(parents=True, exist_ok=True)
 
         extension = image_format.value
         out_path = target_folder / f"{name}.{extension}"
 
-        self._grab_screenshot(
-            window_rectangle=window_rectangle,
-            out_path=out_path,
-            image_format=image_format,
-        )
+        if image.mode != "RGB":
+            # screen contents are opaque, do not encode an alpha channel
+            image = image.convert("RGB")
 
-        return out_path
-
-    def _grab_screenshot(
-        self,
-        window_rectangle: Optional[WindowRectangle],
-        out_path: Path,
-        image_format: ImageFormat,
-    ):
-        if window_rectangle:
-            image = ImageGrab.grab(bbox=window_rectangle, all_screens=True)
-        else:
-            image = ImageGrab.grab()  # full screen
-
-        image_format_settings = self._settings_by_image_format[image_format]
-        image_format_settings_dict = asdict(image_format_settings)
-        keyword_arguments = {
-            key: value
-            for key, value in image_format_settings_dict.items()
-            if value is not None
-        }
+        keyword_arguments = self._save_options_by_image_format[image_format]
+        if image_format is ImageFormat.PNG and png_compress_level is not None:
+            keyword_arguments = {
+                **keyword_arguments,
+                "compress_level": png_compress_level,
+            }
 
         image.save(str(out_path), format=image_format.name, **keyword_arguments)
+
+        return out_path
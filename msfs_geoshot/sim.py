@@ -13,7 +13,6 @@ from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Optional, Set
 import math
 
-import psutil
 from SimConnect import AircraftRequests, SimConnect
 
 from .metadata import EXIF_DATE_FORMAT, EXIF_OFFSET_FORMAT, Metadata
@@ -22,7 +21,12 @@ from .time import (
     get_local_offset_delta,
     string_format_time_delta,
 )
-from .windows import get_window_ids_by_process_name, get_window_title_by_window_id
+from .windows import (
+    get_window_ids_by_process_name,
+    get_window_title_by_window_id,
+    is_process_running,
+    is_window,
+)
 
 
 class SimServiceError(Exception):
@@ -65,8 +69,12 @@ class SimService:
     _sim_executable = "FlightSimulator.exe"
     _sim_window_title = "Microsoft Flight Simulator"
 
+    def __init__(self):
+        # Reused until the window is destroyed, e.g. when the sim quits
+        self._main_window_id: Optional[int] = None
+
     def _is_sim_running(self) -> bool:
-        return self._sim_executable in (p.name() for p in psutil.process_iter())
+        return is_process_running(self._sim_executable)
 
     def _is_user_in_flight(self, sim_location_data: _SimData) -> bool:
         return not (
@@ -76,6 +84,10 @@ class SimService:
         )
 
     def get_simulator_main_window_id(self) -> int:
+        if self._is_cached_main_window_valid():
+            return self._main_window_id  # type: ignore
+        self._main_window_id = None
+
         window_ids = get_window_ids_by_process_name(self._sim_executable)
         results: List[int] = []
         for window_id in window_ids:
@@ -85,7 +97,17 @@ class SimService:
             raise SimServiceError("Could not uniquely identify main simulator window.")
         elif not results:
             raise SimServiceError("Could not find simulator window.")
-        return results[0]
+        self._main_window_id = results[0]
+        return self._main_window_id
+
+    def _is_cached_main_window_valid(self) -> bool:
+        # guard against the handle having been reused by another window
+        return (
+            self._main_window_id is not None
+            and is_window(self._main_window_id)
+            and self._sim_window_title
+            in get_window_title_by_window_id(self._main_window_id)
+        )
 
     def get_flight_data(self) -> Optional[Metadata]:
         if not self._is_sim_running():
@@ -1,18 +1,26 @@
 import datetime
+import functools
 from datetime import timedelta
 from string import Template
 
 import tzlocal
 
 
+@functools.lru_cache(maxsize=1)
+def _get_local_timezone() -> datetime.tzinfo:
+    # tzlocal resolves the zone from the registry, which is slow. The
+    # timezone is not expected to change while the app is running.
+    return tzlocal.get_localzone()
+
+
 def get_datetime_string(timestamp_utc: float, date_format: str) -> str:
-    local_timezone = tzlocal.get_localzone()
+    local_timezone = _get_local_timezone()
     date_datetime = datetime.datetime.fromtimestamp(timestamp_utc, tz=local_timezone)
     return date_datetime.strftime(date_format)
 
 
 def get_local_offset_delta() -> timedelta:
-    local_timezone = tzlocal.get_localzone()
+    local_timezone = _get_local_timezone()
     now = datetime.datetime.now(tz=local_timezone)
     utc_offset = now.utcoffset()
     if utc_offset is None:
@@ -1,11 +1,70 @@
+import ctypes
+import ntpath
 import time
-from typing import List, NamedTuple, Optional
+from ctypes import wintypes
+from typing import Dict, List, NamedTuple, Optional
 
 import psutil
 import win32con
 import win32gui
 import win32process
 
+# Sufficient for QueryFullProcessImageNameW, also for elevated processes
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_MAX_IMAGE_PATH_LENGTH = 32767
+
+_kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)  # type: ignore
+_kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+_kernel32.OpenProcess.restype = wintypes.HANDLE
+_kernel32.QueryFullProcessImageNameW.argtypes = (
+    wintypes.HANDLE,
+    wintypes.DWORD,
+    wintypes.LPWSTR,
+    ctypes.POINTER(wintypes.DWORD),
+)
+_kernel32.QueryFullProcessImageNameW.restype = wintypes.BOOL
+_kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+_kernel32.CloseHandle.restype = wintypes.BOOL
+
+_BI_RGB = 0
+_DIB_RGB_COLORS = 0
+
+
+class _BitmapInfoHeader(ctypes.Structure):
+    _fields_ = [
+        ("biSize", wintypes.DWORD),
+        ("biWidth", wintypes.LONG),
+        ("biHeight", wintypes.LONG),
+        ("biPlanes", wintypes.WORD),
+        ("biBitCount", wintypes.WORD),
+        ("biCompression", wintypes.DWORD),
+        ("biSizeImage", wintypes.DWORD),
+        ("biXPelsPerMeter", wintypes.LONG),
+        ("biYPelsPerMeter", wintypes.LONG),
+        ("biClrUsed", wintypes.DWORD),
+        ("biClrImportant", wintypes.DWORD),
+    ]
+
+
+class _BitmapInfo(ctypes.Structure):
+    _fields_ = [
+        ("bmiHeader", _BitmapInfoHeader),
+        ("bmiColors", wintypes.DWORD * 1),
+    ]
+
+
+_gdi32 = ctypes.WinDLL("gdi32", use_last_error=True)  # type: ignore
+_gdi32.GetDIBits.argtypes = (
+    wintypes.HDC,
+    wintypes.HBITMAP,
+    wintypes.UINT,
+    wintypes.UINT,
+    wintypes.LPVOID,
+    ctypes.POINTER(_BitmapInfo),
+    wintypes.UINT,
+)
+_gdi32.GetDIBits.restype = ctypes.c_int
+
 
 class WindowRectangle(NamedTuple):
     left: int
@@ -16,26 +75,62 @@ class WindowRectangle(NamedTuple):
     def area(self):
         return (self.left - self.right) * (self.top - self.bottom)
 
+    def width(self):
+        return self.right - self.left
+
+    def height(self):
+        return self.bottom - self.top
+
+
+def get_process_name(process_id: int) -> Optional[str]:
+    handle = _kernel32.OpenProcess(
+        _PROCESS_QUERY_LIMITED_INFORMATION, False, process_id
+    )
+    if not handle:
+        return None  # process exited or access denied
+    try:
+        size = wintypes.DWORD(_MAX_IMAGE_PATH_LENGTH)
+        image_path = ctypes.create_unicode_buffer(size.value)
+        if not _kernel32.QueryFullProcessImageNameW(
+            handle, 0, image_path, ctypes.byref(size)
+        ):
+            return None
+    finally:
+        _kernel32.CloseHandle(handle)
+    return ntpath.basename(image_path.value)
+
+
+def is_process_running(process_name: str) -> bool:
+    return any(
+        process.info["name"] == process_name
+        for process in psutil.process_iter(["name"])
+    )
+
 
 def get_window_ids_by_process_name(process_name: str) -> List[int]:
 
-    target_pid: Optional[int] = None
+    # Only resolve names for processes that own a visible window, rather
+    # than scanning every process on the system
+    process_names: Dict[int, Optional[str]] = {}
 
-    for process in psutil.process_iter():
-        if process.name() == process_name:
-            target_pid = process.pid
-            # assumes there is only one process to look at
-            break
-    else:
-        raise OSError(f"Could not find process ID for '{process_name}'")
+    def get_cached_process_name(process_id: int) -> Optional[str]:
+        if process_id not in process_names:
+            process_names[process_id] = get_process_name(process_id)
+        return process_names[process_id]
 
+    target_pid: Optional[int] = None
     matching_window_ids: List[int] = []
 
     def enum_cb(window_id: int, window_list: List[int]):
+        nonlocal target_pid
         if not win32gui.IsWindowVisible(window_id):  # type: ignore[arg]
             return
         _, process_id = win32process.GetWindowThreadProcessId(window_id)  # type: ignore[arg]
-        process = psutil.Process(process_id)
+        if target_pid is None:
+            if get_cached_process_name(process_id) != process_name:
+                return
+            # assumes there is only one process to look at
+            target_pid = process_id
         if process_id == target_pid:
             window_list.append(window_id)
 
@@ -44,6 +139,10 @@ def get_window_ids_by_process_name(process_name: str) -> List[int]:
     return matching_window_ids
 
 
+def is_window(window_id: int) -> bool:
+    return bool(win32gui.IsWindow(window_id))  # type: ignore
+
+
 def get_window_title_by_window_id(window_id: int) -> str:
     return win32gui.GetWindowText(window_id)  # type: ignore
 
@@ -71,3 +170,53 @@ def get_window_rectangle(window_id: int) -> WindowRectangle:
         return outer_window_rect
 
     return inner_window_rect
+
+
+def grab_screen_area(rectangle: WindowRectangle) -> memoryview:
+    """Copy the given screen area, returning a view of its 32-bit BGRX rows"""
+    width, height = rectangle.width(), rectangle.height()
+
+    screen_dc = win32gui.GetDC(0)  # type: ignore
+    memory_dc = win32gui.CreateCompatibleDC(screen_dc)  # type: ignore
+    bitmap = win32gui.CreateCompatibleBitmap(screen_dc, width, height)  # type: ignore
+    try:
+        previous_bitmap = win32gui.SelectObject(memory_dc, bitmap)  # type: ignore
+        win32gui.BitBlt(  # type: ignore
+            memory_dc,
+            0,
+            0,
+            width,
+            height,
+            screen_dc,
+            rectangle.left,
+            rectangle.top,
+            win32con.SRCCOPY,
+        )
+        # GetDIBits requires the bitmap to not be selected into a DC
+        win32gui.SelectObject(memory_dc, previous_bitmap)  # type: ignore
+
+        # Request 32-bit top-down rows regardless of the display's bit depth
+        bitmap_info = _BitmapInfo()
+        bitmap_info.bmiHeader.biSize = ctypes.sizeof(_BitmapInfoHeader)
+        bitmap_info.bmiHeader.biWidth = width
+        bitmap_info.bmiHeader.biHeight = -height
+        bitmap_info.bmiHeader.biPlanes = 1
+        bitmap_info.bmiHeader.biBitCount = 32
+        bitmap_info.bmiHeader.biCompression = _BI_RGB
+
+        pixels = ctypes.create_string_buffer(width * height * 4)
+        if not _gdi32.GetDIBits(
+            int(memory_dc),
+            int(bitmap),
+            0,
+            height,
+            pixels,
+            ctypes.byref(bitmap_info),
+            _DIB_RGB_COLORS,
+        ):
+            raise OSError(ctypes.get_last_error(), "Could not read screen pixels")
+        return memoryview(pixels)  # no extra copy of the frame
+    finally:
+        win32gui.DeleteObject(bitmap)  # type: ignore
+        win32gui.DeleteDC(memory_dc)  # type: ignore
+        win32gui.ReleaseDC(0, screen_dc)  # type: ignore